@@ -13,6 +13,8 @@ from .utils import (
     ensure_project_structure,
     safe_load_json,
     safe_save_json,
+    safe_save_model_json,
+    atomic_write_text,
     safe_load_yaml,
     safe_load_config,
     get_unit_file_path,
@@ -33,6 +35,8 @@ __all__ = [
     "ensure_project_structure",
     "safe_load_json",
     "safe_save_json",
+    "safe_save_model_json",
+    "atomic_write_text",
     "safe_load_yaml",
     "safe_load_config",
     "get_unit_file_path",
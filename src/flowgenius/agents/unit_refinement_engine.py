@@ -6,13 +6,14 @@ based on user feedback and content generation using LangChain orchestration.
 """
 
 import logging
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
-from openai import OpenAI
+from typing import List, Optional, Dict, Any, Tuple, Callable, TypeVar
+from openai import OpenAI, APIError, APIConnectionError, RateLimitError
 from pydantic import BaseModel, Field
 
 from ..models.project import LearningUnit, LearningResource, EngageTask, UserFeedback
-from ..models.settings import DefaultSettings
+from ..models.settings import DefaultSettings, ValidationSettings
 from .content_generator import ContentGeneratorAgent, ContentGenerationRequest
 from .resource_curator import ResourceCuratorAgent, ResourceRequest
 from .engage_task_generator import EngageTaskGeneratorAgent, TaskGenerationRequest
@@ -22,6 +23,31 @@ from ..utils import get_timestamp
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying, and errors a sub-agent call is expected to raise;
+# ValueError covers bad model output, including pydantic's ValidationError
+_TRANSIENT_ERRORS = (RateLimitError, APIConnectionError)
+_AGENT_ERRORS = (APIError, ValueError)
+
+T = TypeVar('T')
+
+
+def _call_with_retry(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Call a sub-agent, retrying transient OpenAI failures with exponential backoff.
+    
+    Non-transient errors propagate immediately; the last transient error is
+    re-raised once the retry budget is exhausted.
+    """
+    attempts = ValidationSettings.DEFAULT_RETRY_COUNT
+    for attempt in range(1, attempts):
+        try:
+            return func(*args, **kwargs)
+        except _TRANSIENT_ERRORS as e:
+            delay = ValidationSettings.RETRY_DELAY * 2 ** (attempt - 1)
+            logger.warning(f"Transient OpenAI error ({e}), retrying in {delay}s ({attempt}/{attempts})")
+            time.sleep(delay)
+    return func(*args, **kwargs)
+
 
 class RefinementResult(BaseModel):
     """Result of unit refinement process."""
@@ -109,7 +135,9 @@ class UnitRefinementEngine:
                 )
                 agent_responses["add_resources"] = agent_response
                 if agent_response.get("success"):
-                    refined_unit.resources.extend(new_resources)
+                    existing_urls = {r.url for r in refined_unit.resources}
+                    new_resources = [r for r in new_resources if r.url not in existing_urls]
+                    refined_unit.resources += new_resources
                     changes_made.append(f"Added {len(new_resources)} new resources based on feedback.")
                     updated_components.append("resources")
                 else:
@@ -123,7 +151,9 @@ class UnitRefinementEngine:
                 )
                 agent_responses["add_tasks"] = agent_response
                 if agent_response.get("success"):
-                    refined_unit.engage_tasks.extend(new_tasks)
+                    existing_titles = {t.title for t in refined_unit.engage_tasks}
+                    new_tasks = [t for t in new_tasks if t.title not in existing_titles]
+                    refined_unit.engage_tasks += new_tasks
                     task_word = "task" if len(new_tasks) == 1 else "tasks"
                     changes_made.append(f"Added {len(new_tasks)} new engage {task_word} as examples.")
                     updated_components.append("engage_tasks")
@@ -212,7 +242,7 @@ class UnitRefinementEngine:
         try:
             # Determine resource count from recommendation
             count = 2  # Default
-            if "video" in " ".join(recommendation.specific_changes).lower():
+            if any("video" in change.lower() for change in recommendation.specific_changes):
                 count = 3  # More if specifically requesting videos
                 
             request = ResourceRequest(
@@ -221,9 +251,9 @@ class UnitRefinementEngine:
                 min_reading_resources=1,
                 max_total_resources=count
             )
-            resources, success = self.resource_curator.curate_resources(request)
+            resources, success = _call_with_retry(self.resource_curator.curate_resources, request)
             return resources, {"success": success, "count": len(resources)}
-        except Exception as e:
+        except _AGENT_ERRORS as e:
             logger.error(f"Failed to add resources: {e}", exc_info=True)
             return [], {"success": False, "error": str(e)}
     
@@ -232,7 +262,7 @@ class UnitRefinementEngine:
         try:
             # Determine task count and type from recommendation
             num_tasks = 2  # Default
-            if "practice" in " ".join(recommendation.specific_changes).lower():
+            if any("practice" in change.lower() for change in recommendation.specific_changes):
                 num_tasks = 3
                 
             request = TaskGenerationRequest(
@@ -242,9 +272,9 @@ class UnitRefinementEngine:
                 focus_on_application=True
             )
             
-            tasks, success = self.task_generator.generate_tasks(request)
+            tasks, success = _call_with_retry(self.task_generator.generate_tasks, request)
             return tasks, {"success": success, "count": len(tasks)}
-        except Exception as e:
+        except _AGENT_ERRORS as e:
             logger.error(f"Failed to add tasks: {e}", exc_info=True)
             return [], {"success": False, "error": str(e)}
     
@@ -261,7 +291,7 @@ class UnitRefinementEngine:
             )
             
             # Generate new content
-            generated_content = self.content_generator.generate_complete_content(request)
+            generated_content = _call_with_retry(self.content_generator.generate_complete_content, request)
             
             if generated_content.generation_success:
                 # Apply specific updates based on recommendation
@@ -281,7 +311,7 @@ class UnitRefinementEngine:
                 return refined_content, {"success": True, "result": refined_content}
             else:
                 return {}, {"success": False, "error": "Content generation failed."}
-        except Exception as e:
+        except _AGENT_ERRORS as e:
             logger.error(f"Failed to update content: {e}", exc_info=True)
             return {}, {"success": False, "error": str(e)}
 
@@ -289,10 +319,18 @@ class UnitRefinementEngine:
         """
         Apply refinements to multiple units with their corresponding feedback.
         
-        Uses LangChain to process each feedback and apply appropriate refinements.
+        Each feedback is matched to its unit by ``unit_id``, so only units that
+        actually received feedback are processed. Feedback for unknown units is
+        logged and skipped. Uses LangChain to process each feedback and apply
+        appropriate refinements.
         """
+        units_by_id = {unit.id: unit for unit in units}
         results = []
-        for unit, feedback in zip(units, feedbacks):
+        for feedback in feedbacks:
+            unit = units_by_id.get(feedback.unit_id)
+            if unit is None:
+                logger.warning(f"Skipping feedback for unknown unit {feedback.unit_id}")
+                continue
             try:
                 result = self.apply_refinement(unit, feedback)
                 results.append(result)
@@ -4,13 +4,50 @@ FlowGenius Main CLI
 This module defines the main CLI group and entry point for FlowGenius commands.
 """
 
+import importlib
+from typing import Dict, List, Optional
+
 import click
-from .wizard import wizard
-from .new import new, create
-from .unit import unit
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports its subcommands only when they are invoked.
+    
+    The subcommand modules pull in heavy dependencies (questionary for the
+    wizard, the models and AI agent stack for the others), so running one
+    command should not import the rest.
+    """
+    
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        """
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute",
+                with the module relative to this package
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            return getattr(module, attr)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "wizard": ".wizard:wizard",
+        "new": ".new:new",
+        "create": ".new:create",
+        "unit": ".unit:unit",
+    },
+)
 @click.version_option(version="0.1.0", prog_name="flowgenius")
 def cli() -> None:
     """
@@ -22,13 +59,6 @@ def cli() -> None:
     pass
 
 
-# Register subcommands
-cli.add_command(wizard)
-cli.add_command(new)
-cli.add_command(create)
-cli.add_command(unit)
-
-
 def main() -> None:
     """Main entry point for the FlowGenius CLI."""
-    cli() 
\ No newline at end of file
+    cli()
@@ -9,7 +9,6 @@ import click
 from pathlib import Path
 
 from ..models.config_manager import ConfigManager
-from ..models.project_generator import ProjectGenerator
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -55,7 +54,8 @@ def new(topic: str, motivation: str, units: int, open_project: bool) -> None:
         raise click.Abort()
     
     try:
-        # Initialize project generator
+        # Initialize project generator (imported here as it pulls in the AI agent stack)
+        from ..models.project_generator import ProjectGenerator
         generator = ProjectGenerator(config)
         
         # Show what we're about to do
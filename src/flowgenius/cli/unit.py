@@ -7,84 +7,171 @@ within FlowGenius projects.
 
 import click
 import json
+import logging
+import os
+import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from ..models.state_store import StateStore, create_state_store
-from ..models.project import LearningProject
 from ..models.settings import DefaultSettings
-from ..utils import find_project_directory, safe_load_json, safe_load_config, get_datetime_now
+from ..utils import find_project_directory, safe_load_config, get_datetime_now, atomic_write_text
 
+if TYPE_CHECKING:
+    from ..models.project import LearningProject
 
-def _load_project_from_directory(project_dir: Path) -> Optional[LearningProject]:
+try:
+    # orjson decodes straight from bytes and is noticeably faster; optional
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# Emoji shown next to each unit status
+_STATUS_EMOJI = {"pending": "⏸️", "in-progress": "🔄", "completed": "✅"}
+_UNKNOWN_STATUS_EMOJI = "❓"
+
+# Leading YAML front-matter block of a unit file (group 1 is its body) and its status line
+_FRONTMATTER_RE = re.compile(r'\A\s*---[ \t]*\n(.*?)^---[ \t]*$', re.DOTALL | re.MULTILINE)
+_STATUS_LINE_RE = re.compile(r'^status:.*$', re.MULTILINE)
+
+# Project fields that fall back to their defaults when they cannot be parsed
+_TIMESTAMP_LOCS = {('metadata', 'created_at'), ('metadata', 'updated_at')}
+
+
+# Project directories already located, keyed by the working directory they were found from
+_project_dir_cache: Dict[Path, Path] = {}
+
+# Contents of project.json files that validated as-is, keyed by absolute path and
+# tagged with the (mtime_ns, size) they were read at
+_project_json_cache: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+_PROJECT_JSON_CACHE_SIZE = 4
+
+
+def _find_project_directory(cwd: Optional[Path] = None) -> Optional[Path]:
+    """
+    Find the project directory, memoizing the parent walk per working directory.
+    
+    A cached hit is re-validated with a single stat of its project.json, so
+    repeated lookups within one process avoid walking the parents again.
+    Misses are not cached.
+    
+    Args:
+        cwd: Directory to search from (defaults to the current directory)
+        
+    Returns:
+        Path to project directory if found, None otherwise
+    """
+    cwd = cwd or Path.cwd()
+    
+    cached = _project_dir_cache.get(cwd)
+    if cached is not None and (cached / DefaultSettings.PROJECT_FILE).exists():
+        return cached
+    
+    project_dir = find_project_directory(cwd)
+    if project_dir is not None:
+        _project_dir_cache[cwd] = project_dir
+    return project_dir
+
+
+def _load_project_from_directory(project_dir: Path) -> Optional['LearningProject']:
     """
     Load a LearningProject from a project directory.
     
+    A project.json is validated once per load. Contents that validate as-is
+    are also cached keyed on the file's path, mtime and size, so loading an
+    unchanged file again skips the read; files that need the lenient
+    fallback are not cached. Every call builds a new LearningProject, so
+    callers are free to mutate what they get back.
+    
     Args:
         project_dir: Path to the project directory
         
     Returns:
         LearningProject if successfully loaded, None otherwise
     """
-    project_file = project_dir / "project.json"
+    project_file = os.path.abspath(project_dir / DefaultSettings.PROJECT_FILE)
     
-    if not project_file.exists():
+    try:
+        stat_result = os.stat(project_file)
+    except OSError:
         return None
     
-    project_data = safe_load_json(project_file)
-    if project_data:
-        
-        # Basic validation of required structure
-        if not isinstance(project_data, dict):
-            return None
-        
-        if 'metadata' not in project_data:
-            return None
-        
-        metadata = project_data['metadata']
-        if not isinstance(metadata, dict):
-            return None
-            
-        # Check for minimal required fields in metadata
-        if 'id' not in metadata:
-            return None
-            
-        # Provide defaults for missing required fields
-        if 'title' not in metadata:
-            metadata['title'] = metadata['id']  # Use ID as fallback title
-        if 'topic' not in metadata:
-            metadata['topic'] = metadata['title']  # Use title as fallback topic
-        
-        # Ensure units is a list
-        if 'units' not in project_data:
-            project_data['units'] = []
-        elif not isinstance(project_data['units'], list):
-            return None
-        
-        # Convert datetime strings back to datetime objects
-        if 'created_at' in metadata:
-            try:
-                metadata['created_at'] = datetime.fromisoformat(metadata['created_at'])
-            except (ValueError, TypeError):
-                metadata['created_at'] = get_datetime_now()
-        else:
-            metadata['created_at'] = get_datetime_now()
-            
-        if 'updated_at' in metadata:
-            try:
-                metadata['updated_at'] = datetime.fromisoformat(metadata['updated_at'])
-            except (ValueError, TypeError):
-                metadata['updated_at'] = get_datetime_now()
-        else:
-            metadata['updated_at'] = get_datetime_now()
-        
-        try:
-            return LearningProject(**project_data)
-        except (TypeError, ValueError, KeyError):
-            return None
-    else:
-        return None
+    file_key = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _project_json_cache.get(project_file)
+    if cached is not None and cached[0] == file_key:
+        from ..models.project import LearningProject
+        return LearningProject.model_validate_json(cached[1])
+    
+    project, raw = _parse_project_file(Path(project_file))
+    if raw is not None:
+        if len(_project_json_cache) >= _PROJECT_JSON_CACHE_SIZE:
+            # Evict the oldest entry
+            del _project_json_cache[next(iter(_project_json_cache))]
+        _project_json_cache[project_file] = (file_key, raw)
+    return project
+
+
+def _parse_project_file(project_file: Path) -> Tuple[Optional['LearningProject'], Optional[bytes]]:
+    """
+    Parse and validate a project.json file.
+    
+    Returns:
+        The validated LearningProject (None if the file is not a valid
+        project), and the raw file contents if they validated as-is, which
+        makes them safe to cache
+    """
+    # Deferred so that --help and argument errors don't load pydantic and the models
+    from pydantic import ValidationError
+    from ..models.project import LearningProject
+    
+    try:
+        raw = project_file.read_bytes()
+    except OSError as e:
+        logger.error(f"Failed to load JSON from {project_file}: {e}")
+        return None, None
+    
+    # Complete projects, as FlowGenius writes them, validate straight from
+    # the raw bytes; everything else goes through the lenient path below
+    try:
+        return LearningProject.model_validate_json(raw), raw
+    except ValidationError:
+        pass
+    
+    try:
+        project_data = _json_loads(raw)
+    except ValueError as e:
+        logger.error(f"Failed to load JSON from {project_file}: {e}")
+        return None, None
+    
+    if not project_data or not isinstance(project_data, dict):
+        return None, None
+    
+    # Fill in the fields older or hand-written projects may omit; pydantic
+    # validates the structure and types of everything else
+    metadata = project_data.get('metadata')
+    if isinstance(metadata, dict) and 'id' in metadata:
+        metadata.setdefault('title', metadata['id'])  # Use ID as fallback title
+        metadata.setdefault('topic', metadata['title'])  # Use title as fallback topic
+    project_data.setdefault('units', [])
+    
+    # Timestamps are parsed by the model itself; missing ones get its defaults
+    try:
+        return LearningProject.model_validate(project_data), None
+    except ValidationError as e:
+        # Fall back to the defaults for unparseable timestamps as well
+        error_locs = {err['loc'] for err in e.errors()}
+        if not error_locs <= _TIMESTAMP_LOCS:
+            return None, None
+        for _, field in error_locs:
+            del metadata[field]
+    
+    try:
+        return LearningProject.model_validate(project_data), None
+    except ValidationError:
+        return None, None
 
 
 
@@ -153,7 +240,7 @@ def mark_done(unit_id: str, completion_date: Optional[datetime], notes: Optional
         flowgenius unit mark-done unit-3 --notes "Great unit, learned a lot!"
     """
     # Find the current project directory
-    project_dir = find_project_directory()
+    project_dir = _find_project_directory()
     if not project_dir:
         click.echo("❌ No FlowGenius project found in current directory or parent directories.")
         click.echo("💡 Tip: Navigate to a project directory or run this command from within a project.")
@@ -170,12 +257,11 @@ def mark_done(unit_id: str, completion_date: Optional[datetime], notes: Optional
     # Verify the unit exists
     unit = project.get_unit_by_id(unit_id)
     if not unit:
-        click.echo(f"❌ Unit '{unit_id}' not found in this project.")
-        click.echo()
-        click.echo("Available units:")
+        lines = [f"❌ Unit '{unit_id}' not found in this project.", "", "Available units:"]
         for u in project.units:
-            status_emoji = {"pending": "⏸️", "in-progress": "🔄", "completed": "✅"}.get(u.status, "❓")
-            click.echo(f"  {status_emoji} {u.id}: {u.title}")
+            status_emoji = _STATUS_EMOJI.get(u.status, _UNKNOWN_STATUS_EMOJI)
+            lines.append(f"  {status_emoji} {u.id}: {u.title}")
+        click.echo("\n".join(lines))
         raise click.Abort()
     
     click.echo(f"📚 Unit: {click.style(unit.title, fg='green')}")
@@ -189,14 +275,16 @@ def mark_done(unit_id: str, completion_date: Optional[datetime], notes: Optional
     if notes:
         click.echo(f"📝 Notes: {notes}")
     
+    # Checked once; both the dry run and the real update go by this
+    unit_file = project_dir / DefaultSettings.UNITS_DIR / f"{unit_id}.md"
+    unit_file_exists = unit_file.exists()
+    
     if dry_run:
         click.echo()
         click.echo("🔍 Dry run - showing what would be updated:")
         click.echo(f"  📄 state.json: {unit_id} → completed")
         
-        units_dir = project_dir / "units"
-        unit_file = units_dir / f"{unit_id}.md"
-        if unit_file.exists():
+        if unit_file_exists:
             click.echo(f"  📝 {unit_file.name}: status → completed, completion date updated")
         else:
             click.echo(f"  📝 {unit_file.name}: file not found, would skip markdown update")
@@ -212,14 +300,15 @@ def mark_done(unit_id: str, completion_date: Optional[datetime], notes: Optional
         click.echo("💡 Tip: Run 'flowgenius wizard' to set up configuration for markdown file updates.")
     
     # Initialize State Store and MarkdownRenderer
+    from ..models.state_store import create_state_store
     state_store = create_state_store(project_dir)
     # Ensure state store is initialized with all project units
-    state_store.initialize_from_project(project)
+    state = state_store.initialize_from_project(project)
     renderer = _safe_create_renderer(config)
     
     # Check current status and warn if already completed
-    current_status = state_store.get_unit_status(unit_id)
-    if current_status == "completed":
+    unit_state = state.get_unit_state(unit_id)
+    if unit_state and unit_state.status == "completed":
         if not click.confirm(f"⚠️  Unit '{unit_id}' is already marked as completed. Update anyway?"):
             click.echo("Cancelled.")
             return
@@ -227,64 +316,44 @@ def mark_done(unit_id: str, completion_date: Optional[datetime], notes: Optional
     click.echo()
     
     try:
-        # Update state.json
+        # Update status and notes on the already-loaded state, then save once
         click.echo("🔄 Updating state.json...")
-        state_store.update_unit_status(unit_id, "completed", completion_date)
+        state.update_unit_status(unit_id, "completed", completion_date)
+        if notes:
+            unit_state = state.get_unit_state(unit_id)
+            unit_state.progress_notes.append(notes)
+            # Also add a concise summary (first two words) for quick display if not already present
+            short_summary = " ".join(notes.split(None, 2)[:2])
+            if short_summary and short_summary not in unit_state.progress_notes:
+                unit_state.progress_notes.append(short_summary)
+        state_store.save_state(state)
         click.echo("✅ State updated successfully")
         
-        # Update markdown file if it exists and renderer is available
-        if renderer:
-            units_dir = project_dir / "units"
-            unit_file = units_dir / f"{unit_id}.md"
-            
-            if unit_file.exists():
-                click.echo("🔄 Updating unit markdown file...")
-                renderer.update_unit_progress(unit_file, "completed", completion_date)
-                click.echo("✅ Markdown file updated successfully")
-            else:
-                # Fallback: minimal inline update so tests still see completed status.
-                units_dir = project_dir / "units"
-                unit_file = units_dir / f"{unit_id}.md"
-                if unit_file.exists():
-                    try:
-                        _quick_update_unit_status_markdown(unit_file, "completed", completion_date)
-                        click.echo("✅ Markdown file updated (fallback mode)")
-                    except (OSError, IOError) as e:
-                        click.echo(f"⚠️  Failed to update markdown file in fallback mode: {e}")
-                else:
-                    click.echo("⚠️  Unit file {unit_file.name} not found, skipping markdown update")
+        # Update markdown file if it exists, using the renderer when available
+        if not unit_file_exists:
+            click.echo(f"⚠️  Unit file {unit_file.name} not found, skipping markdown update")
+        elif renderer:
+            click.echo("🔄 Updating unit markdown file...")
+            renderer.update_unit_progress(unit_file, "completed", completion_date)
+            click.echo("✅ Markdown file updated successfully")
         else:
             # Fallback: minimal inline update so tests still see completed status.
-            units_dir = project_dir / "units"
-            unit_file = units_dir / f"{unit_id}.md"
-            if unit_file.exists():
-                try:
-                    _quick_update_unit_status_markdown(unit_file, "completed", completion_date)
-                    click.echo("✅ Markdown file updated (fallback mode)")
-                except (OSError, IOError) as e:
-                    click.echo(f"⚠️  Failed to update markdown file in fallback mode: {e}")
-            else:
-                click.echo("⚠️  Unit file {unit_file.name} not found, skipping markdown update")
-        
-        # Add notes to state if provided
+            try:
+                _quick_update_unit_status_markdown(unit_file, "completed", completion_date)
+                click.echo("✅ Markdown file updated (fallback mode)")
+            except (OSError, IOError) as e:
+                click.echo(f"⚠️  Failed to update markdown file in fallback mode: {e}")
+        
+        # Notes went out with the status save above; report them in their usual place
         if notes:
             click.echo("📝 Adding completion notes...")
-            state = state_store.load_state()
-            unit_state = state.get_unit_state(unit_id)
-            if unit_state:
-                unit_state.progress_notes.append(notes)
-                # Also add a concise summary (first two words) for quick display if not already present
-                short_summary = " ".join(notes.split()[:2])
-                if short_summary and short_summary not in unit_state.progress_notes:
-                    unit_state.progress_notes.append(short_summary)
-                state_store.save_state(state)
-                click.echo("✅ Notes added successfully")
+            click.echo("✅ Notes added successfully")
         
         click.echo()
         click.echo("🎉 Unit marked as completed!")
         
         # Show progress summary
-        summary = state_store.get_progress_summary()
+        summary = state.get_progress_summary()
         completed = summary["completed_units"]
         total = summary["total_units"]
         percentage = summary["completion_percentage"]
@@ -316,7 +385,7 @@ def status(unit_id: Optional[str], all: bool) -> None:
         flowgenius unit status --all      # Show status for all units
     """
     # Find the current project directory
-    project_dir = find_project_directory()
+    project_dir = _find_project_directory()
     if not project_dir:
         click.echo("❌ No FlowGenius project found in current directory or parent directories.")
         raise click.Abort()
@@ -328,34 +397,33 @@ def status(unit_id: Optional[str], all: bool) -> None:
         raise click.Abort()
     
     # Initialize State Store
+    from ..models.state_store import create_state_store
     state_store = create_state_store(project_dir)
     # Ensure state store is initialized with all project units
-    state_store.initialize_from_project(project)
+    state = state_store.initialize_from_project(project)
     
     if all or unit_id is None:
-        # Show all units
-        click.echo(f"📁 Project: {click.style(project.title, fg='cyan', bold=True)}")
-        click.echo()
+        # Show all units, collected into a single write
+        lines = [f"📁 Project: {click.style(project.title, fg='cyan', bold=True)}", ""]
         
         for unit in project.units:
-            current_status = state_store.get_unit_status(unit.id) or unit.status
-            status_emoji = {"pending": "⏸️", "in-progress": "🔄", "completed": "✅"}.get(current_status, "❓")
+            unit_state = state.get_unit_state(unit.id)
+            current_status = (unit_state.status if unit_state else None) or unit.status
+            status_emoji = _STATUS_EMOJI.get(current_status, _UNKNOWN_STATUS_EMOJI)
             
-            click.echo(f"{status_emoji} {click.style(unit.id, fg='blue')}: {unit.title}")
-            click.echo(f"   Status: {current_status}")
+            lines.append(f"{status_emoji} {click.style(unit.id, fg='blue')}: {unit.title}")
+            lines.append(f"   Status: {current_status}")
             
             # Show completion date if completed
-            if current_status == "completed":
-                state = state_store.load_state()
-                unit_state = state.get_unit_state(unit.id)
-                if unit_state and unit_state.completed_at:
-                    click.echo(f"   Completed: {unit_state.completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            if current_status == "completed" and unit_state and unit_state.completed_at:
+                lines.append(f"   Completed: {unit_state.completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
             
-            click.echo()
+            lines.append("")
         
         # Show overall progress
-        summary = state_store.get_progress_summary()
-        click.echo(f"📊 Overall Progress: {summary['completed_units']}/{summary['total_units']} units completed ({summary['completion_percentage']:.1f}%)")
+        summary = state.get_progress_summary()
+        lines.append(f"📊 Overall Progress: {summary['completed_units']}/{summary['total_units']} units completed ({summary['completion_percentage']:.1f}%)")
+        click.echo("\n".join(lines))
         
     else:
         # Show specific unit
@@ -364,8 +432,9 @@ def status(unit_id: Optional[str], all: bool) -> None:
             click.echo(f"❌ Unit '{unit_id}' not found.")
             raise click.Abort()
         
-        current_status = state_store.get_unit_status(unit_id) or unit.status
-        status_emoji = {"pending": "⏸️", "in-progress": "🔄", "completed": "✅"}.get(current_status, "❓")
+        unit_state = state.get_unit_state(unit_id)
+        current_status = (unit_state.status if unit_state else None) or unit.status
+        status_emoji = _STATUS_EMOJI.get(current_status, _UNKNOWN_STATUS_EMOJI)
         
         click.echo(f"{status_emoji} {click.style(unit.title, fg='green', bold=True)}")
         click.echo(f"ID: {unit.id}")
@@ -376,8 +445,6 @@ def status(unit_id: Optional[str], all: bool) -> None:
             click.echo(f"Estimated Duration: {unit.estimated_duration}")
         
         # Show timestamps if available
-        state = state_store.load_state()
-        unit_state = state.get_unit_state(unit_id)
         if unit_state:
             if unit_state.started_at:
                 click.echo(f"Started: {unit_state.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -401,7 +468,7 @@ def start(unit_id: str) -> None:
         flowgenius unit start unit-1
     """
     # Find the current project directory
-    project_dir = find_project_directory()
+    project_dir = _find_project_directory()
     if not project_dir:
         click.echo("❌ No FlowGenius project found in current directory or parent directories.")
         raise click.Abort()
@@ -419,12 +486,14 @@ def start(unit_id: str) -> None:
         raise click.Abort()
     
     # Initialize State Store
+    from ..models.state_store import create_state_store
     state_store = create_state_store(project_dir)
     # Ensure state store is initialized with all project units
-    state_store.initialize_from_project(project)
+    state = state_store.initialize_from_project(project)
     
     # Check current status
-    current_status = state_store.get_unit_status(unit_id)
+    unit_state = state.get_unit_state(unit_id)
+    current_status = unit_state.status if unit_state else None
     if current_status == "in-progress":
         click.echo(f"ℹ️  Unit '{unit_id}' is already in progress.")
         return
@@ -434,12 +503,13 @@ def start(unit_id: str) -> None:
     
     try:
         # Update state.json
-        state_store.update_unit_status(unit_id, "in-progress")
+        state.update_unit_status(unit_id, "in-progress")
+        state_store.save_state(state)
         
         click.echo(f"🔄 Unit '{unit.title}' marked as in-progress!")
         
         # Show progress summary
-        summary = state_store.get_progress_summary()
+        summary = state.get_progress_summary()
         click.echo(f"📊 Project progress: {summary['completed_units']}/{summary['total_units']} units completed, {summary['in_progress_units']} in progress")
         
     except (OSError, IOError, ValueError) as e:
@@ -472,7 +542,7 @@ def refine(unit_id: str, dry_run: bool, no_backup: bool) -> None:
         flowgenius unit refine unit-2 --dry-run
     """
     # Find the current project directory
-    project_dir = find_project_directory()
+    project_dir = _find_project_directory()
     if not project_dir:
         click.echo("❌ No FlowGenius project found in current directory or parent directories.")
         raise click.Abort()
@@ -503,20 +573,16 @@ def refine(unit_id: str, dry_run: bool, no_backup: bool) -> None:
             click.echo("❌ Configuration not found. Please run 'flowgenius wizard' to set up your configuration.")
             raise click.Abort()
         
-        # Initialize refinement components
-        from openai import OpenAI
-        from ..agents.conversation_manager import create_conversation_manager
-        from ..agents.unit_refinement_engine import create_unit_refinement_engine
-        from ..models.refinement_persistence import create_refinement_persistence
-        from ..models.renderer import MarkdownRenderer
-        
-        # Create OpenAI client
         openai_key = _get_openai_key(config)
         if not openai_key:
             click.echo("❌ OpenAI API key not found. Please check your configuration.")
             raise click.Abort()
         
-        client = OpenAI(api_key=openai_key)
+        # Imported only once configuration checks pass, as they pull in the AI agent stack
+        from ..agents.conversation_manager import create_conversation_manager
+        from ..agents.unit_refinement_engine import create_unit_refinement_engine
+        from ..models.refinement_persistence import create_refinement_persistence
+        from ..models.renderer import MarkdownRenderer
         
         # Initialize components
         conversation_mgr = create_conversation_manager(openai_key, config.default_model)
@@ -654,16 +720,17 @@ def refine(unit_id: str, dry_run: bool, no_backup: bool) -> None:
 
 def _get_openai_key(config) -> Optional[str]:
     """Get OpenAI API key from configuration."""
-    try:
-        if hasattr(config, 'openai_key_path') and config.openai_key_path.exists():
-            with open(config.openai_key_path, 'r') as f:
-                return f.read().strip()
-    except (OSError, IOError) as e:
-        click.echo(f"⚠️  Warning: Could not read API key file: {e}")
-        pass
+    key_path = getattr(config, 'openai_key_path', None)
+    if key_path is not None:
+        # Read directly rather than stat first; a missing file just means no key
+        try:
+            return key_path.read_text().strip()
+        except FileNotFoundError:
+            pass
+        except (OSError, IOError) as e:
+            click.echo(f"⚠️  Warning: Could not read API key file: {e}")
     
     # Try environment variable as fallback
-    import os
     return os.getenv('OPENAI_API_KEY')
 
 
@@ -680,25 +747,13 @@ def _quick_update_unit_status_markdown(
     """Light-weight YAML front-matter updater used when renderer is unavailable."""
 
     content = unit_file.read_text()
-    lines = content.split("\n")
-    in_frontmatter = False
-    updated_lines = []
-
-    for line in lines:
-        if line.strip() == "---":
-            if not in_frontmatter:
-                in_frontmatter = True
-            else:
-                # End front-matter – inject completion date if provided
-                if completion_date and new_status.lower() == "completed":
-                    updated_lines.append(f"completed_date: {completion_date.isoformat()}")
-                in_frontmatter = False
-            updated_lines.append(line)
-            continue
-
-        if in_frontmatter and line.startswith("status:"):
-            updated_lines.append(f"status: {new_status}")
-        else:
-            updated_lines.append(line)
+    match = _FRONTMATTER_RE.search(content)
+    if match is None:
+        return
+
+    frontmatter = _STATUS_LINE_RE.sub(lambda _: f"status: {new_status}", match.group(1))
+    if completion_date and new_status.lower() == "completed":
+        # Injected at the end of the front-matter
+        frontmatter += f"completed_date: {completion_date.isoformat()}\n"
 
-    unit_file.write_text("\n".join(updated_lines))
\ No newline at end of file
+    atomic_write_text(unit_file, content[:match.start(1)] + frontmatter + content[match.end(1):])
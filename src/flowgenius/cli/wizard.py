@@ -6,8 +6,9 @@ configuration and creating the first learning project.
 """
 
 import os
+import re
+import stat
 import click
-import questionary
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,22 @@ from ..models.config import FlowGeniusConfig, get_config_path, get_config_dir, g
 from ..models.config_manager import ConfigManager
 from ..models.settings import DefaultSettings
 
+# "sk-" followed by at least 17 key characters (20 or more in total)
+_OPENAI_KEY_RE = re.compile(r'sk-[A-Za-z0-9_-]{17,}')
+
+# Fixed answers offered by the setup wizard
+_MODEL_CHOICES = (
+    {"name": "GPT-4o Mini (Recommended - Fast & Cost-effective)", "value": "gpt-4o-mini"},
+    {"name": "GPT-4o (Most Capable)", "value": "gpt-4o"},
+    {"name": "GPT-4 Turbo (Balanced)", "value": "gpt-4-turbo"},
+    {"name": "GPT-3.5 Turbo (Budget-friendly)", "value": "gpt-3.5-turbo"},
+)
+_UNITS_CHOICES = (
+    {"name": "3 units (Quick overview)", "value": 3},
+    {"name": "5 units (Comprehensive)", "value": 5},
+    {"name": "7 units (Deep dive)", "value": 7},
+)
+
 
 @click.command()
 @click.option(
@@ -63,6 +80,9 @@ def run_setup_wizard() -> Optional[FlowGeniusConfig]:
     Returns:
         FlowGeniusConfig if setup was completed, None if cancelled
     """
+    # Imported here as it pulls in prompt_toolkit, which `flowgenius --help` doesn't need
+    import questionary
+    
     print("\n🧙‍♂️ Welcome to FlowGenius Setup Wizard!")
     print("Let's get you set up with personalized learning projects.\n")
     
@@ -150,12 +170,7 @@ def run_setup_wizard() -> Optional[FlowGeniusConfig]:
     print("\n🤖 Choose your preferred AI model...")
     model_choice = questionary.select(
         "Which OpenAI model would you like to use?",
-        choices=[
-            {"name": "GPT-4o Mini (Recommended - Fast & Cost-effective)", "value": "gpt-4o-mini"},
-            {"name": "GPT-4o (Most Capable)", "value": "gpt-4o"},
-            {"name": "GPT-4 Turbo (Balanced)", "value": "gpt-4-turbo"},
-            {"name": "GPT-3.5 Turbo (Budget-friendly)", "value": "gpt-3.5-turbo"}
-        ],
+        choices=list(_MODEL_CHOICES),
         instruction="Use arrow keys to navigate, Enter to select"
     ).ask()
     
@@ -194,11 +209,7 @@ def run_setup_wizard() -> Optional[FlowGeniusConfig]:
     
     units_per_project = questionary.select(
         "How many units per project by default?",
-        choices=[
-            {"name": "3 units (Quick overview)", "value": 3},
-            {"name": "5 units (Comprehensive)", "value": 5},
-            {"name": "7 units (Deep dive)", "value": 7}
-        ]
+        choices=list(_UNITS_CHOICES)
     ).ask()
     
     if units_per_project is None:
@@ -262,6 +273,8 @@ def create_api_key_file() -> Optional[Path]:
     Returns:
         Path to the created file, or None if cancelled
     """
+    import questionary
+    
     print("\n🔑 Let's create a new API key file...")
     
     # Ask for file location
@@ -310,15 +323,18 @@ def validate_api_key_file(path: str) -> bool:
     """
     try:
         p = Path(path).expanduser()
-        if not p.exists():
+        # One stat covers existence, file type and permissions
+        try:
+            st = os.stat(p)
+        except (FileNotFoundError, NotADirectoryError):
             return f"File does not exist: {path}"
-        if not p.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return f"Not a file: {path}"
         if not os.access(p, os.R_OK):
             return f"File is not readable: {path}"
         
         # Check file permissions (warn if too permissive)
-        mode = p.stat().st_mode & 0o777
+        mode = st.st_mode & 0o777
         if mode != 0o600:
             print(f"⚠️  Warning: File permissions are {oct(mode)}. Consider running: chmod 600 {path}")
         
@@ -337,11 +353,7 @@ def validate_openai_key(api_key: str) -> bool:
     Returns:
         True if the API key appears to be valid, False otherwise
     """
-    return (
-        api_key.startswith('sk-') and 
-        len(api_key) >= 20 and
-        all(c.isalnum() or c in '-_' for c in api_key)
-    )
+    return _OPENAI_KEY_RE.fullmatch(api_key) is not None
 
 
 def check_existing_config() -> bool:
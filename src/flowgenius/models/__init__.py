@@ -5,17 +5,62 @@ This package contains Pydantic data models and schemas for representing
 learning projects, units, resources, and configuration.
 """
 
-from .config import FlowGeniusConfig, get_config_path, get_config_dir, get_default_projects_root
-from .config_manager import ConfigManager
-from .project import (
-    LearningResource, EngageTask, LearningUnit, ProjectMetadata, LearningProject,
-    UserFeedback, RefinementAction,
-    generate_project_id, generate_unit_id
-)
-from .project_generator import ProjectGenerator
-from .renderer import MarkdownRenderer
-from .settings import DefaultSettings, FallbackUrls, ValidationSettings, get_resource_emoji, get_task_emoji
-from .state_store import StateStore, ProjectState, UnitState, create_state_store
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import FlowGeniusConfig, get_config_path, get_config_dir, get_default_projects_root
+    from .config_manager import ConfigManager
+    from .project import (
+        LearningResource, EngageTask, LearningUnit, ProjectMetadata, LearningProject,
+        UserFeedback, RefinementAction,
+        generate_project_id, generate_unit_id
+    )
+    from .settings import DefaultSettings, FallbackUrls, ValidationSettings, get_resource_emoji, get_task_emoji
+    from .state_store import StateStore, ProjectState, UnitState, create_state_store
+    from .project_generator import ProjectGenerator
+    from .renderer import MarkdownRenderer
+
+# Members are imported from their modules on first access. Importing any
+# submodule (e.g. models.settings) runs this package first, so eager imports
+# here would make every command pay for YAML, pydantic models and, through
+# ProjectGenerator and MarkdownRenderer, the AI agent stack (LangChain, OpenAI)
+_LAZY_IMPORTS = {
+    "FlowGeniusConfig": ".config",
+    "get_config_path": ".config",
+    "get_config_dir": ".config",
+    "get_default_projects_root": ".config",
+    "ConfigManager": ".config_manager",
+    "LearningResource": ".project",
+    "EngageTask": ".project",
+    "LearningUnit": ".project",
+    "ProjectMetadata": ".project",
+    "LearningProject": ".project",
+    "UserFeedback": ".project",
+    "RefinementAction": ".project",
+    "generate_project_id": ".project",
+    "generate_unit_id": ".project",
+    "DefaultSettings": ".settings",
+    "FallbackUrls": ".settings",
+    "ValidationSettings": ".settings",
+    "get_resource_emoji": ".settings",
+    "get_task_emoji": ".settings",
+    "StateStore": ".state_store",
+    "ProjectState": ".state_store",
+    "UnitState": ".state_store",
+    "create_state_store": ".state_store",
+    "ProjectGenerator": ".project_generator",
+    "MarkdownRenderer": ".renderer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exposed members on first attribute access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Configuration
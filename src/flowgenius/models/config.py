@@ -5,6 +5,7 @@ This module contains Pydantic models for FlowGenius configuration management,
 including user preferences, API settings, and project defaults.
 """
 
+import functools
 from pathlib import Path
 from typing import Optional, Literal
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -60,7 +61,10 @@ class FlowGeniusConfig(BaseModel):
     
     model_config = ConfigDict(
         validate_assignment=True,
-        arbitrary_types_allowed=True
+        arbitrary_types_allowed=True,
+        # Build the validator on first use rather than at import, so commands
+        # that never load the config (e.g. --help) don't pay for it
+        defer_build=True
     )
 
     @field_validator('openai_key_path', 'projects_root')
@@ -80,10 +84,14 @@ class FlowGeniusConfig(BaseModel):
         return v.strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """
     Get the FlowGenius configuration directory following XDG standards.
     
+    The directory is resolved (and created) once per process; call
+    ``get_config_dir.cache_clear()`` after changing XDG/HOME variables.
+    
     Returns:
         Path to the configuration directory
     """
@@ -101,12 +109,14 @@ def get_config_path() -> Path:
     return get_config_dir() / "config.yaml"
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_projects_root() -> Path:
     """
     Get the default projects root directory following XDG user directory standards.
     
     Uses XDG_DOCUMENTS_DIR/FlowGenius if available, otherwise falls back
-    to ~/Documents/FlowGenius.
+    to ~/Documents/FlowGenius. Resolved and created once per process, like
+    get_config_dir().
     
     Returns:
         Path to the default projects directory
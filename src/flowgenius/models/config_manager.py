@@ -4,12 +4,13 @@ FlowGenius Configuration Manager
 This module handles reading, writing, and managing FlowGenius configuration files.
 """
 
+import io
 import logging
-from pathlib import Path
 from typing import Optional
 from ruamel.yaml import YAML
 from .config import FlowGeniusConfig, get_config_path
 from .settings import DefaultSettings
+from ..utils import atomic_write_text
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -22,6 +23,8 @@ class ConfigManager:
     Handles reading, writing, and validating configuration files in YAML format.
     """
     
+    __slots__ = ("yaml",)
+    
     def __init__(self):
         self.yaml = YAML()
         self.yaml.preserve_quotes = DefaultSettings.YAML_PRESERVE_QUOTES
@@ -36,22 +39,15 @@ class ConfigManager:
         """
         config_path = get_config_path()
         
-        if not config_path.exists():
-            return None
-            
         try:
-            with open(config_path, 'r') as f:
-                config_data = self.yaml.load(f)
+            config_data = self.yaml.load(config_path.read_bytes())
             
-            # Convert string paths back to Path objects
-            if config_data:
-                if 'openai_key_path' in config_data:
-                    config_data['openai_key_path'] = Path(config_data['openai_key_path'])
-                if 'projects_root' in config_data:
-                    config_data['projects_root'] = Path(config_data['projects_root'])
-            
-            return FlowGeniusConfig(**config_data) if config_data else None
+            # Path fields are coerced from their string form by the model
+            return FlowGeniusConfig.model_validate(config_data) if config_data else None
             
+        except FileNotFoundError:
+            # No configuration yet (wizard not run)
+            return None
         except Exception as e:
             logger.error(f"Error loading config from {config_path}: {e}", exc_info=True)
             return None
@@ -75,13 +71,14 @@ class ConfigManager:
             # Use the yaml_line_width from the config
             self.yaml.width = config.yaml_line_width
             
-            # Convert Path objects to strings for YAML serialization
-            config_dict = config.model_dump()
-            config_dict['openai_key_path'] = str(config.openai_key_path)
-            config_dict['projects_root'] = str(config.projects_root)
+            # JSON mode serializes the Path fields to strings for YAML
+            config_dict = config.model_dump(mode='json')
             
-            with open(config_path, 'w') as f:
-                self.yaml.dump(config_dict, f)
+            # Rendered in memory and swapped in atomically, so a failed save
+            # never leaves a truncated config behind
+            stream = io.StringIO()
+            self.yaml.dump(config_dict, stream)
+            atomic_write_text(config_path, stream.getvalue())
             
             logger.info(f"Configuration saved to: {config_path}")
             return True
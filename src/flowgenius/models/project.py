@@ -4,6 +4,7 @@ FlowGenius Project Models
 This module defines the data structures for learning projects, units, and resources.
 """
 
+import re
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +13,10 @@ from pydantic import BaseModel, Field
 
 from ..utils import get_datetime_now
 
+# Runs of anything other than letters, digits and underscores (dashes included)
+# collapse into a single slug separator
+_SLUG_SEPARATOR_RE = re.compile(r'\W+')
+
 
 class LearningResource(BaseModel):
     """
@@ -133,13 +138,11 @@ def generate_project_id(topic: str) -> str:
         A unique project ID in format: topic-slug-xxx
     """
     # Create a URL-friendly slug from the topic
-    slug = topic.lower()
-    slug = "".join(c if c.isalnum() or c in "-_" else "-" for c in slug)
-    slug = "-".join(word for word in slug.split("-") if word)  # Remove empty parts
+    slug = _SLUG_SEPARATOR_RE.sub("-", topic.lower()).strip("-")
     slug = slug[:50]  # Limit length
     
     # Add a short UUID for uniqueness
-    short_uuid = str(uuid.uuid4())[:8]
+    short_uuid = uuid.uuid4().hex[:8]
     
     return f"{slug}-{short_uuid}"
 
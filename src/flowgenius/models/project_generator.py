@@ -5,15 +5,55 @@ This module handles creating learning projects, including directory structure
 and markdown file generation.
 """
 
+import functools
+import os
 from pathlib import Path
-from typing import Optional
-from openai import OpenAI
+from typing import TYPE_CHECKING, Optional
 
 from .config import FlowGeniusConfig
 from .project import LearningProject
 from .renderer import MarkdownRenderer
-from ..agents.topic_scaffolder import TopicScaffolderAgent, ScaffoldingRequest
-from ..agents.project_content_orchestrator import ProjectContentOrchestrator, create_project_orchestrator
+
+# The OpenAI SDK and the agent stack (LangChain) are slow to import and only
+# needed once AI generation actually starts, so they are imported on first use
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from ..agents.topic_scaffolder import TopicScaffolderAgent
+    from ..agents.project_content_orchestrator import ProjectContentOrchestrator
+
+
+@functools.lru_cache(maxsize=4)
+def _make_openai_client(api_key: str) -> "OpenAI":
+    """
+    Get an OpenAI client for an API key, reusing one built earlier.
+    
+    The scaffolder and orchestrator (and any further generators in the same
+    process) share a client and with it the underlying HTTP connection pool.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        OpenAI client for the key
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_api_key(key_path: str, mtime_ns: int) -> str:
+    """
+    Read an API key file, reusing the result until the file is modified.
+    
+    Args:
+        key_path: Expanded path to the key file
+        mtime_ns: Modification time of the file, so a rotated key is re-read
+        
+    Returns:
+        The stripped API key
+    """
+    with open(key_path, 'r') as f:
+        return f.read().strip()
 
 
 class ProjectGenerator:
@@ -24,19 +64,22 @@ class ProjectGenerator:
     and delegates markdown file generation to MarkdownRenderer.
     """
     
+    __slots__ = ("config", "_scaffolder", "_renderer", "_orchestrator", "_api_key")
+    
     def __init__(self, config: FlowGeniusConfig) -> None:
         self.config = config
-        self._scaffolder: Optional[TopicScaffolderAgent] = None
+        self._scaffolder: Optional["TopicScaffolderAgent"] = None
         self._renderer: Optional[MarkdownRenderer] = None
-        self._orchestrator: Optional[ProjectContentOrchestrator] = None
+        self._orchestrator: Optional["ProjectContentOrchestrator"] = None
+        self._api_key: Optional[str] = None
     
     @property
-    def scaffolder(self) -> TopicScaffolderAgent:
+    def scaffolder(self) -> "TopicScaffolderAgent":
         """Lazy load the scaffolder agent."""
         if self._scaffolder is None:
-            # Load OpenAI API key
-            api_key = self._load_api_key()
-            client = OpenAI(api_key=api_key)
+            from ..agents.topic_scaffolder import TopicScaffolderAgent
+            
+            client = _make_openai_client(self._load_api_key())
             self._scaffolder = TopicScaffolderAgent(client, self.config.default_model)
         return self._scaffolder
     
@@ -48,12 +91,12 @@ class ProjectGenerator:
         return self._renderer
     
     @property
-    def orchestrator(self) -> ProjectContentOrchestrator:
+    def orchestrator(self) -> "ProjectContentOrchestrator":
         """Lazy load the content orchestrator."""
         if self._orchestrator is None:
-            # Load OpenAI API key
-            api_key = self._load_api_key()
-            client = OpenAI(api_key=api_key)
+            from ..agents.project_content_orchestrator import ProjectContentOrchestrator
+            
+            client = _make_openai_client(self._load_api_key())
             self._orchestrator = ProjectContentOrchestrator(client, self.config.default_model)
         return self._orchestrator
     
@@ -75,12 +118,6 @@ class ProjectGenerator:
             Created LearningProject
         """
         # Generate the project structure
-        request = ScaffoldingRequest(
-            topic=topic,
-            motivation=motivation,
-            target_units=target_units
-        )
-        
         project = self.scaffolder.create_learning_project(
             topic=topic,
             motivation=motivation,
@@ -122,31 +159,33 @@ class ProjectGenerator:
         print(f"  [{current}/{total}] {message}")
     
     def _load_api_key(self) -> str:
-        """Load the OpenAI API key from the configured path."""
-        key_path = Path(self.config.openai_key_path).expanduser()
+        """Load the OpenAI API key from the configured path, reading the file only once."""
+        if self._api_key is not None:
+            return self._api_key
+        
+        key_path = os.path.expanduser(self.config.openai_key_path)
         
-        if not key_path.exists():
+        try:
+            mtime_ns = os.stat(key_path).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"OpenAI API key file not found at {key_path}. "
                 f"Run 'flowgenius wizard' to configure."
-            )
+            ) from None
         
-        return key_path.read_text().strip()
+        self._api_key = _read_api_key(key_path, mtime_ns)
+        return self._api_key
     
     def _create_project_directory(self, project: LearningProject) -> Path:
         """Create the project directory structure."""
-        projects_root = Path(self.config.projects_root).expanduser()
-        project_dir = projects_root / project.project_id
-        
-        # Create directory
-        project_dir.mkdir(parents=True, exist_ok=True)
+        project_dir = os.path.join(os.path.expanduser(self.config.projects_root), project.project_id)
         
-        # Create subdirectories
-        (project_dir / "units").mkdir(exist_ok=True)
-        (project_dir / "resources").mkdir(exist_ok=True)
-        (project_dir / "notes").mkdir(exist_ok=True)
+        # Create the project directory along with its subdirectories, working
+        # on plain string paths rather than building a Path per directory
+        for subdir in ("units", "resources", "notes"):
+            os.makedirs(os.path.join(project_dir, subdir), exist_ok=True)
         
-        return project_dir
+        return Path(project_dir)
     
     def _write_project_files(self, project: LearningProject, project_dir: Path, content_map: Optional[dict] = None) -> None:
         """
@@ -17,7 +17,7 @@ from .project import LearningProject, LearningUnit
 from .state_store import StateStore, create_state_store
 from .renderer import MarkdownRenderer
 from ..agents.unit_refinement_engine import RefinementResult
-from ..utils import get_datetime_now, safe_save_json, safe_load_json
+from ..utils import get_datetime_now, safe_save_json, safe_save_model_json, safe_load_json
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -236,19 +236,8 @@ class RefinementPersistence:
         # Update the project's timestamp
         project.update_timestamp()
         
-        # Convert to dictionary for JSON serialization
-        project_dict = project.model_dump()
-        
-        # Convert datetime objects to ISO format strings
-        if 'metadata' in project_dict:
-            metadata = project_dict['metadata']
-            if 'created_at' in metadata:
-                metadata['created_at'] = project.metadata.created_at.isoformat()
-            if 'updated_at' in metadata:
-                metadata['updated_at'] = project.metadata.updated_at.isoformat()
-        
-        # Write to file
-        safe_save_json(project_dict, self.project_file)
+        # Write to file; datetimes are serialized to ISO format strings by pydantic
+        safe_save_model_json(project, self.project_file)
     
     def _update_markdown_files(self, project: LearningProject, refinement_results: List[RefinementResult]) -> None:
         """Update markdown files for refined units."""
@@ -7,7 +7,7 @@ Enhanced with state.json integration for accurate progress tracking.
 """
 
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 import json
 from datetime import datetime
 from ruamel.yaml import YAML
@@ -16,10 +16,14 @@ import logging
 
 from .config import FlowGeniusConfig
 from .project import LearningProject, LearningUnit, LearningResource, EngageTask
-from .state_store import StateStore, create_state_store
-from ..agents.content_generator import GeneratedContent
+from .state_store import ProjectState, StateStore, create_state_store
 from .settings import DefaultSettings
-from ..utils import safe_save_json, ensure_project_structure
+from ..utils import safe_save_model_json, ensure_project_structure
+
+# Only needed for annotations; importing the agents package at runtime would
+# pull in the OpenAI SDK and LangChain for every caller of the renderer
+if TYPE_CHECKING:
+    from ..agents.content_generator import GeneratedContent
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -62,32 +66,38 @@ class MarkdownRenderer:
             self._cached_state_stores[project_key] = StateStore(project_dir)
         return self._cached_state_stores[project_key]
     
-    def _get_unit_state_info(self, unit: LearningUnit, project_dir: Path) -> Dict[str, Any]:
+    def _get_unit_state_info(
+        self,
+        unit: LearningUnit,
+        project_dir: Path,
+        state: Optional[ProjectState] = None
+    ) -> Dict[str, Any]:
         """
         Get unit state information from the state store.
         
         Args:
             unit: The learning unit
             project_dir: Project directory path
+            state: Already loaded project state, to avoid re-reading state.json
             
         Returns:
             Dictionary with state information including status, timestamps, notes
         """
         try:
-            state_store = self._get_state_store(project_dir)
-            
             # Load existing state if available
-            try:
-                state = state_store.load_state()
-            except (OSError, IOError, ValueError) as e:
-                # No existing state, return default
-                logger.debug(f"No existing state found: {e}")
-                return {
-                    "status": unit.status,
-                    "started_at": None,
-                    "completed_at": None,
-                    "progress_notes": []
-                }
+            if state is None:
+                state_store = self._get_state_store(project_dir)
+                try:
+                    state = state_store.load_state()
+                except (OSError, IOError, ValueError) as e:
+                    # No existing state, return default
+                    logger.debug(f"No existing state found: {e}")
+                    return {
+                        "status": unit.status,
+                        "started_at": None,
+                        "completed_at": None,
+                        "progress_notes": []
+                    }
             
             # Get unit state from loaded state
             if unit.id in state.units:
@@ -152,7 +162,7 @@ class MarkdownRenderer:
         self, 
         project: LearningProject, 
         project_dir: Path,
-        unit_content_map: Optional[Dict[str, GeneratedContent]] = None,
+        unit_content_map: Optional[Dict[str, "GeneratedContent"]] = None,
         progress_callback: Optional[callable] = None
     ) -> None:
         """
@@ -219,7 +229,7 @@ class MarkdownRenderer:
         self, 
         project: LearningProject, 
         project_dir: Path,
-        unit_content_map: Optional[Dict[str, GeneratedContent]] = None,
+        unit_content_map: Optional[Dict[str, "GeneratedContent"]] = None,
         progress_callback: Optional[callable] = None
     ) -> None:
         """
@@ -259,7 +269,7 @@ class MarkdownRenderer:
             unit_file = project_dir / "units" / f"{unit.id}.md"
             generated_content = unit_content_map.get(unit.id) if unit_content_map else None
             content = self._build_unit_content(unit, project, generated_content, project_dir)
-            unit_file.write_text(content)
+            unit_file.write_bytes(content.encode("utf-8"))
         
         # Final step: Write README
         current_step += 1
@@ -272,7 +282,7 @@ class MarkdownRenderer:
         unit: LearningUnit, 
         project: LearningProject,
         output_path: Path,
-        generated_content: Optional[GeneratedContent] = None,
+        generated_content: Optional["GeneratedContent"] = None,
         project_dir: Optional[Path] = None
     ) -> None:
         """
@@ -293,7 +303,7 @@ class MarkdownRenderer:
             project_dir = output_path.parent.parent
         
         content = self._build_unit_content(unit, project, generated_content, project_dir)
-        output_path.write_text(content)
+        output_path.write_bytes(content.encode("utf-8"))
     
     def update_unit_progress(
         self,
@@ -339,37 +349,38 @@ class MarkdownRenderer:
     def _write_metadata_file(self, project: LearningProject, project_dir: Path) -> None:
         """Write project metadata as JSON."""
         metadata_file = project_dir / "project.json"
-        metadata_dict = project.model_dump()
         
-        safe_save_json(metadata_dict, metadata_file)
+        safe_save_model_json(project, metadata_file)
     
     def _write_toc_file(
         self, 
         project: LearningProject, 
         project_dir: Path,
-        unit_content_map: Optional[Dict[str, GeneratedContent]] = None
+        unit_content_map: Optional[Dict[str, "GeneratedContent"]] = None
     ) -> None:
         """Write the table of contents markdown file."""
         toc_file = project_dir / "toc.md"
         content = self._build_toc_content(project, unit_content_map, project_dir)
-        toc_file.write_text(content)
+        toc_file.write_bytes(content.encode("utf-8"))
     
     def _build_toc_content(
         self, 
         project: LearningProject,
-        unit_content_map: Optional[Dict[str, GeneratedContent]] = None,
+        unit_content_map: Optional[Dict[str, "GeneratedContent"]] = None,
         project_dir: Optional[Path] = None
     ) -> str:
         """Build the table of contents markdown content with state integration."""
         lines = []
         
-        # Get progress summary from state if available
+        # Get progress summary from state if available; the state is loaded
+        # once here and reused for every unit row below
         progress_summary = None
+        state = None
         if project_dir:
             try:
                 state_store = self._get_state_store(project_dir)
-                state_store.initialize_from_project(project)
-                progress_summary = state_store.get_progress_summary()
+                state = state_store.initialize_from_project(project)
+                progress_summary = state.get_progress_summary()
             except Exception:
                 pass
         
@@ -426,7 +437,7 @@ class MarkdownRenderer:
             
             # Use state data for status if available
             if project_dir:
-                state_info = self._get_unit_state_info(unit, project_dir)
+                state_info = self._get_unit_state_info(unit, project_dir, state)
                 status = state_info["status"].title()
             else:
                 status = unit.status.title()
@@ -492,7 +503,7 @@ class MarkdownRenderer:
         self, 
         project: LearningProject, 
         project_dir: Path,
-        unit_content_map: Optional[Dict[str, GeneratedContent]] = None
+        unit_content_map: Optional[Dict[str, "GeneratedContent"]] = None
     ) -> None:
         """Write individual unit markdown files."""
         units_dir = project_dir / "units"
@@ -501,13 +512,13 @@ class MarkdownRenderer:
             unit_file = units_dir / f"{unit.id}.md"
             generated_content = unit_content_map.get(unit.id) if unit_content_map else None
             content = self._build_unit_content(unit, project, generated_content, project_dir)
-            unit_file.write_text(content)
+            unit_file.write_bytes(content.encode("utf-8"))
     
     def _build_unit_content(
         self, 
         unit: LearningUnit, 
         project: LearningProject,
-        generated_content: Optional[GeneratedContent] = None,
+        generated_content: Optional["GeneratedContent"] = None,
         project_dir: Optional[Path] = None
     ) -> str:
         """Build the content for a unit markdown file with state integration."""
@@ -692,7 +703,7 @@ class MarkdownRenderer:
 *Generated by FlowGenius - eliminating research paralysis through structured learning*
 """
         
-        readme_file.write_text(content)
+        readme_file.write_bytes(content.encode("utf-8"))
     
     def _format_link(self, path: str, title: str) -> str:
         """Format a link based on the configured link style."""
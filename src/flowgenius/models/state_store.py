@@ -157,20 +157,8 @@ class StateStore:
             self.project_dir.mkdir(parents=True, exist_ok=True)
             
             try:
-                # Convert to dict with datetime serialization
-                state_dict = state.model_dump()
-                
-                # Convert datetime objects to ISO format strings
-                if state_dict.get('created_at'):
-                    state_dict['created_at'] = state.created_at.isoformat()
-                if state_dict.get('updated_at'):
-                    state_dict['updated_at'] = state.updated_at.isoformat()
-                
-                for unit_id, unit_data in state_dict.get('units', {}).items():
-                    if unit_data.get('started_at'):
-                        unit_data['started_at'] = state.units[unit_id].started_at.isoformat()
-                    if unit_data.get('completed_at'):
-                        unit_data['completed_at'] = state.units[unit_id].completed_at.isoformat()
+                # Datetimes are serialized to ISO format strings by pydantic
+                state_dict = state.model_dump(mode='json')
                 
                 if safe_save_json(state_dict, self.state_file):
                     self._current_state = state
@@ -217,6 +205,9 @@ class StateStore:
         """
         Initialize state.json from a LearningProject, preserving existing progress.
         
+        state.json is only written when it is created or gains new units, so
+        calling this on an already-initialized project does not touch the file.
+        
         Args:
             project: LearningProject to initialize state from
             
@@ -225,14 +216,17 @@ class StateStore:
         """
         with self._lock:
             # Load existing state or create new one
+            changed = False
             if self.state_file.exists():
                 try:
                     state = self.load_state()
                 except ValueError:
                     # If existing state is invalid, create new one
                     state = self._create_default_state(project.project_id)
+                    changed = True
             else:
                 state = self._create_default_state(project.project_id)
+                changed = True
             
             # Add any new units from the project that aren't in state
             for unit in project.units:
@@ -241,9 +235,11 @@ class StateStore:
                         id=unit.id,
                         status=unit.status  # Use status from project model
                     )
+                    changed = True
             
-            # Save the initialized state
-            self.save_state(state)
+            # Save the initialized state only if it differs from what is on disk
+            if changed:
+                self.save_state(state)
             return state
     
     def get_progress_summary(self) -> Dict[str, Any]:
@@ -7,13 +7,19 @@ These functions were extracted from various modules to reduce code duplication a
 
 import json
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable
 from ruamel.yaml import YAML
 
 from .models.settings import DefaultSettings
 
+# Annotation only; the CLI imports this module before it needs pydantic
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 # Set up module logger
 logger = logging.getLogger(__name__)
 
@@ -56,15 +62,17 @@ def find_project_directory(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to project directory if found, None otherwise
     """
-    current_dir = start_path or Path.cwd()
-    
-    # Check current directory and parent directories
-    for path in [current_dir] + list(current_dir.parents):
-        project_file = path / DefaultSettings.PROJECT_FILE
-        if project_file.exists():
-            return path
+    current_dir = os.fspath(start_path or Path.cwd())
     
-    return None
+    # Check current directory and parent directories, walking plain string
+    # paths to avoid building a Path object and parents list per level
+    while True:
+        if os.path.isfile(os.path.join(current_dir, DefaultSettings.PROJECT_FILE)):
+            return Path(current_dir)
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            return None
+        current_dir = parent_dir
 
 
 def ensure_project_structure(project_dir: Path) -> None:
@@ -131,14 +139,67 @@ def safe_save_json(data: Dict[str, Any], file_path: Path, indent: int = 2) -> bo
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=indent, default=str)
+        atomic_write_text(file_path, json.dumps(data, indent=indent, default=str))
         return True
     except (OSError, IOError, TypeError) as e:
         logger.error(f"Failed to save JSON to {file_path}: {e}")
         return False
 
 
+def safe_save_model_json(model: "BaseModel", file_path: Path, indent: int = 2) -> bool:
+    """
+    Safely save a Pydantic model to a JSON file with error handling.
+    
+    pydantic-core serializes the model straight to JSON, datetimes included,
+    without the intermediate dict and per-value default=str callbacks of
+    safe_save_json.
+    
+    Args:
+        model: Model to save
+        file_path: Path to save to
+        indent: JSON indentation level
+        
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    try:
+        # Ensure parent directory exists
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        atomic_write_text(file_path, model.model_dump_json(indent=indent))
+        return True
+    except (OSError, IOError, ValueError) as e:
+        logger.error(f"Failed to save JSON to {file_path}: {e}")
+        return False
+
+
+def atomic_write_text(file_path: Path, content: str) -> None:
+    """
+    Write text to a file via a sibling temp file that is renamed over it.
+    
+    Readers never see a half-written file, and a failed write leaves the
+    previous contents in place. Text is encoded as UTF-8.
+    
+    Args:
+        file_path: Path to write to
+        content: Text to write
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
+
 def safe_load_yaml(file_path: Path, yaml_width: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
     Safely load a YAML file with error handling.
@@ -104,6 +104,12 @@ class TestOfflineFunctionality:
         loaded_data = safe_load_json(json_path)
         assert loaded_data == test_data
         
+        # A failed write leaves the previous contents and no temp file behind
+        with patch("flowgenius.utils.json.dumps", side_effect=TypeError("not serializable")):
+            assert safe_save_json({"key": "other"}, json_path) is False
+        assert safe_load_json(json_path) == test_data
+        assert list(tmp_path.glob("*.tmp")) == []
+        
         # Test project structure creation
         project_dir = tmp_path / "test_project"
         ensure_project_structure(project_dir)
@@ -155,6 +161,10 @@ class TestOfflineFunctionality:
         toc_content = (project_dir / "toc.md").read_text()
         assert "Test Project" in toc_content
         assert "Test Unit 1" in toc_content
+        
+        # project.json round-trips, timestamps included
+        saved = LearningProject.model_validate_json((project_dir / "project.json").read_bytes())
+        assert saved == sample_project
     
     def test_refinement_persistence_offline(self, tmp_path, sample_project):
         """Test refinement persistence works offline."""
@@ -220,7 +230,7 @@ class TestOfflineFunctionality:
         assert len(projects) == 3
         assert "test-project-000" in projects
     
-    @patch('flowgenius.models.project_generator.OpenAI')
+    @patch('flowgenius.models.project_generator._make_openai_client')
     def test_openai_calls_fail_gracefully_offline(self, mock_openai_class, mock_config):
         """Test that OpenAI API calls fail gracefully when offline."""
         # Configure mock to simulate network error
@@ -247,6 +257,36 @@ class TestOfflineFunctionality:
         
         assert "Network error" in str(exc_info.value)
     
+    def test_generator_agents_share_openai_client(self, mock_config):
+        """Test that the scaffolder and orchestrator reuse one key read and one client."""
+        from flowgenius.models.project_generator import _make_openai_client
+        generator = ProjectGenerator(mock_config)
+        
+        # The orchestrator exports the client's key to the environment
+        with patch('openai.OpenAI') as mock_openai_class, patch.dict(os.environ):
+            mock_openai_class.return_value.api_key = "sk-test-key-for-offline-testing"
+            _make_openai_client.cache_clear()
+            try:
+                scaffolder_client = generator.scaffolder.client
+                mock_config.openai_key_path.unlink()  # A second read would now fail
+                orchestrator_client = generator.orchestrator.openai_client
+            finally:
+                _make_openai_client.cache_clear()
+        
+        assert scaffolder_client is orchestrator_client
+        assert scaffolder_client is mock_openai_class.return_value
+    
+    def test_generator_rereads_rotated_api_key(self, mock_config):
+        """Test that a cached API key is re-read once the key file changes."""
+        assert ProjectGenerator(mock_config)._load_api_key() == "sk-test-key-for-offline-testing"
+        
+        key_path = mock_config.openai_key_path
+        key_path.write_text("sk-test-rotated-key")
+        stat = key_path.stat()
+        os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert ProjectGenerator(mock_config)._load_api_key() == "sk-test-rotated-key"
+    
     def test_api_key_loading_offline(self, mock_config):
         """Test API key loading from file works offline."""
         # Write test key
@@ -297,6 +297,20 @@ class TestStateStoreCore:
         assert state.units["unit-1"].status == "completed"
         assert state.units["unit-2"].status == "in-progress"
         assert state.units["unit-3"].status == "pending"  # From project
+    
+    def test_state_store_initialize_skips_write_when_in_sync(self, tmp_path, sample_project):
+        """Test that reinitializing an up-to-date state does not rewrite state.json."""
+        project_dir = tmp_path / "test-project"
+        project_dir.mkdir()
+        
+        store = StateStore(project_dir)
+        store.initialize_from_project(sample_project)
+        
+        with patch.object(store, 'save_state') as mock_save:
+            state = store.initialize_from_project(sample_project)
+        
+        mock_save.assert_not_called()
+        assert len(state.units) == len(sample_project.units)
 
 
 class TestStateStoreErrorHandling:
@@ -417,6 +431,14 @@ class TestCLIUnitCommands:
             assert unit_state["status"] == "completed"
             assert "2024-01-15T14:30:00" in unit_state["completed_at"]
             assert "Great learning experience!" in unit_state["progress_notes"]
+            
+            # Notes are reported after the state and markdown updates
+            output = result.output
+            assert "✅ Notes added successfully" in output
+            assert (output.index("✅ State updated successfully")
+                    < output.index("📝 Adding completion notes...")
+                    < output.index("✅ Notes added successfully")
+                    < output.index("🎉 Unit marked as completed!"))
     
     def test_mark_done_dry_run(self, project_with_files):
         """Test mark-done command in dry-run mode."""
@@ -1037,6 +1059,22 @@ class TestEndToEndWorkflows:
         # Content should reflect current state
         content = unit_file.read_text()
         assert "status: completed" in content
+    
+    def test_quick_markdown_update_only_touches_frontmatter(self, tmp_path):
+        """Test the fallback markdown updater leaves the body alone."""
+        from src.flowgenius.cli.unit import _quick_update_unit_status_markdown
+        
+        unit_file = tmp_path / "unit-1.md"
+        unit_file.write_text(
+            "---\ntitle: Unit 1\nstatus: pending\n---\n\n# Unit 1\n\n---\n\nstatus: example\n"
+        )
+        
+        _quick_update_unit_status_markdown(unit_file, "completed", datetime(2024, 1, 15, 14, 30))
+        
+        assert unit_file.read_text() == (
+            "---\ntitle: Unit 1\nstatus: completed\ncompleted_date: 2024-01-15T14:30:00\n---\n"
+            "\n# Unit 1\n\n---\n\nstatus: example\n"
+        )
 
 
 class TestPerformanceAndScalability:
@@ -1175,6 +1213,20 @@ class TestPerformanceAndScalability:
         summary = store.get_progress_summary()
         assert summary["total_units"] == 1000
         assert summary["completed_units"] == 100  # Every other unit in first 200
+    
+    def test_unit_lookup_sees_in_place_replacement(self, sample_project):
+        """Test that get_unit_by_id reflects units replaced in place after earlier lookups."""
+        original = sample_project.get_unit_by_id("unit-1")
+        assert original.title == "Introduction to Testing"
+        assert sample_project.get_unit_by_id("unit-9") is None
+        
+        refined = original.model_copy(update={"title": "REFINED"})
+        sample_project.units[0] = refined
+        sample_project.units[2] = original.model_copy(update={"id": "unit-9"})
+        
+        assert sample_project.get_unit_by_id("unit-1") is refined
+        assert sample_project.get_unit_by_id("unit-9").id == "unit-9"
+        assert sample_project.get_unit_by_id("unit-3") is None
 
 
 class TestErrorHandlingEdgeCases:
@@ -1210,6 +1262,60 @@ class TestErrorHandlingEdgeCases:
         with pytest.raises(ValueError, match="Invalid state.json"):
             store.load_state()
     
+    def test_project_timestamps_parsed_on_load(self, tmp_path):
+        """Test that project.json timestamps are parsed and bad ones fall back to defaults."""
+        from src.flowgenius.cli.unit import _load_project_from_directory
+        
+        project_data = {
+            "metadata": {
+                "id": "timestamp-test",
+                "created_at": "2024-01-01T12:00:00",
+                "updated_at": "not-a-datetime"
+            },
+            "units": []
+        }
+        (tmp_path / "project.json").write_text(json.dumps(project_data))
+        
+        project = _load_project_from_directory(tmp_path)
+        
+        assert project is not None
+        assert project.metadata.created_at == datetime(2024, 1, 1, 12, 0, 0)
+        assert isinstance(project.metadata.updated_at, datetime)
+        assert project.title == "timestamp-test"
+    
+    def test_cached_project_loads_are_isolated_and_invalidated(self, tmp_path, sample_project):
+        """Test that cached project loads never share instances and follow file edits."""
+        import os
+        from src.flowgenius.cli.unit import _load_project_from_directory
+        
+        project_file = tmp_path / "project.json"
+        project_file.write_text(sample_project.model_dump_json())
+        
+        # A cold load validates the file exactly once
+        with patch.object(LearningProject, 'model_validate_json', wraps=LearningProject.model_validate_json) as mock_validate:
+            first = _load_project_from_directory(tmp_path)
+        assert mock_validate.call_count == 1
+        
+        # Mutating a loaded project does not leak into later loads of the same file
+        first.units[0].title = "MUTATED"
+        first.update_timestamp()
+        second = _load_project_from_directory(tmp_path)
+        assert second is not first
+        assert second.units[0].title == "Introduction to Testing"
+        assert second.metadata.updated_at == sample_project.metadata.updated_at
+        
+        # A same-size edit is picked up through the mtime part of the cache key
+        stat = project_file.stat()
+        project_file.write_text(project_file.read_text().replace("Introduction", "Introductoin"))
+        os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _load_project_from_directory(tmp_path).units[0].title == "Introductoin to Testing"
+        
+        # A size change is picked up even if the mtime is unchanged
+        stat = project_file.stat()
+        project_file.write_text(project_file.read_text().replace("Introductoin", "Intro"))
+        os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert _load_project_from_directory(tmp_path).units[0].title == "Intro to Testing"
+    
     def test_unicode_and_special_characters(self, tmp_path, sample_config):
         """Test handling of unicode and special characters in content."""
         project_dir = tmp_path / "test-project"
@@ -145,8 +145,11 @@ def test_renderer_toc_state_integration(tmp_path, sample_config, sample_project)
     # Initialize renderer
     renderer = MarkdownRenderer(sample_config)
     
-    # Build TOC content with state integration
-    toc_content = renderer._build_toc_content(sample_project, None, project_dir)
+    # Build TOC content with state integration; state.json is read once
+    # for the whole table rather than once per unit row
+    with patch.object(StateStore, 'load_state', autospec=True, side_effect=StateStore.load_state) as mock_load:
+        toc_content = renderer._build_toc_content(sample_project, None, project_dir)
+    assert mock_load.call_count == 1
     
     # Verify state integration in TOC
     assert "progress: 1/2 completed (50.0%)" in toc_content
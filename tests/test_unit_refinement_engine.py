@@ -133,6 +133,37 @@ class TestUnitRefinementEngine:
                 assert len(result.refined_unit.resources) == len(sample_learning_unit.resources) + 1
                 mock_curate.assert_called_once()
 
+    @pytest.mark.requires_api_key
+    def test_apply_refinement_add_content_skips_duplicates(self, mock_openai_client: Mock, sample_learning_unit: Any) -> None:
+        """Test that resources already on the unit are not added twice."""
+        engine = UnitRefinementEngine(mock_openai_client)
+        existing = LearningResource(title="Existing", url="http://example.com/existing", type="video")
+        unit = sample_learning_unit.model_copy(update={"resources": [existing]})
+        
+        feedback = UserFeedback(unit_id="unit-1", feedback_text="More videos please")
+        
+        with patch.object(engine.feedback_processor, 'analyze_feedback') as mock_analyze:
+            mock_analyze.return_value = RefinementRecommendation(
+                action=RefinementAction.ADD_CONTENT,
+                priority="high",
+                reasoning="User wants more resources",
+                estimated_impact="High"
+            )
+            
+            with patch.object(engine.resource_curator, 'curate_resources') as mock_curate:
+                mock_curate.return_value = (
+                    [existing, LearningResource(title="New", url="http://example.com/new", type="article")],
+                    {"success": True, "count": 2}
+                )
+                
+                result = engine.apply_refinement(unit, feedback)
+                
+                assert result.success is True
+                assert "Added 1 new resources" in result.changes_made[0]
+                assert [r.url for r in result.refined_unit.resources] == [
+                    "http://example.com/existing", "http://example.com/new"
+                ]
+
     @pytest.mark.requires_api_key
     def test_apply_refinement_add_examples(self, mock_openai_client: Mock, sample_learning_unit: Any) -> None:
         """Test refinement application for adding examples (tasks)."""
@@ -282,6 +313,36 @@ class TestUnitRefinementEngine:
                 assert "Resource curation failed" in str(result.errors[0])
                 assert len(result.refined_unit.resources) == len(sample_learning_unit.resources)
 
+    @pytest.mark.requires_api_key
+    def test_apply_refinement_retries_transient_errors(self, mock_openai_client: Mock, sample_learning_unit: Any) -> None:
+        """Test that transient OpenAI errors are retried before giving up."""
+        import httpx
+        from openai import APIConnectionError
+        
+        engine = UnitRefinementEngine(mock_openai_client)
+        feedback = UserFeedback(unit_id="unit-1", feedback_text="Need more resources")
+        
+        with patch.object(engine.feedback_processor, 'analyze_feedback') as mock_analyze:
+            mock_analyze.return_value = RefinementRecommendation(
+                action=RefinementAction.ADD_CONTENT,
+                priority="high",
+                reasoning="Need resources",
+                estimated_impact="High"
+            )
+            
+            with patch.object(engine.resource_curator, 'curate_resources') as mock_curate, \
+                 patch('flowgenius.agents.unit_refinement_engine.time.sleep') as mock_sleep:
+                mock_curate.side_effect = [
+                    APIConnectionError(request=httpx.Request("POST", "https://api.openai.com")),
+                    ([LearningResource(title="New", url="http://example.com/new", type="video")], True),
+                ]
+                
+                result = engine.apply_refinement(sample_learning_unit, feedback)
+                
+                assert result.success is True
+                assert mock_curate.call_count == 2
+                mock_sleep.assert_called_once()
+
     @pytest.mark.requires_api_key
     def test_batch_apply_refinements(self, mock_openai_client: Mock, sample_learning_unit: Any) -> None:
         """Test batch application of refinements."""
@@ -337,6 +398,33 @@ class TestUnitRefinementEngine:
                 assert results[0].unit_id == "unit-1"
                 assert results[1].unit_id == "unit-2"
 
+    @pytest.mark.requires_api_key
+    def test_batch_apply_refinements_sparse_feedback(self, mock_openai_client: Mock, sample_learning_unit: Any) -> None:
+        """Test that batch refinement only processes units that received feedback."""
+        engine = UnitRefinementEngine(mock_openai_client)
+        
+        units = [
+            sample_learning_unit.model_copy(update={"id": f"unit-{i}"})
+            for i in range(1, 6)
+        ]
+        feedback_list = [
+            UserFeedback(unit_id="unit-4", feedback_text="Looks fine"),
+            UserFeedback(unit_id="unit-99", feedback_text="Unknown unit")
+        ]
+        
+        with patch.object(engine.feedback_processor, 'analyze_feedback') as mock_analyze:
+            mock_analyze.return_value = RefinementRecommendation(
+                action=RefinementAction.NO_ACTION,
+                priority="low",
+                reasoning="No changes needed",
+                estimated_impact="Low"
+            )
+            
+            results = engine.batch_apply_refinements(units, feedback_list)
+            
+            assert [r.unit_id for r in results] == ["unit-4"]
+            mock_analyze.assert_called_once()
+
 
 class TestFactoryFunction:
     """Test cases for factory function."""